@@ -5,7 +5,13 @@ Anyparser LangChain Integration
 __version__ = "0.0.2"
 
 import asyncio
-from typing import List, Literal, Optional, Union
+import copy
+import dataclasses
+import hashlib
+import os
+from collections import OrderedDict
+from itertools import chain
+from typing import AsyncIterator, Iterator, List, Literal, Optional, Tuple, Union
 
 from anyparser_core import (
     Anyparser,
@@ -19,10 +25,27 @@ from anyparser_core import (
 )
 from langchain_core.documents import Document
 
+# Parsed documents keyed on (file path, file content hash, parser options), least recently used first
+_RESULT_CACHE: "OrderedDict[Tuple[str, str, str], List[Document]]" = OrderedDict()
+
+
+def _file_digest(file_path: str) -> str:
+    """Compute the SHA-256 hex digest of a file, reading it in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class AnyparserLoader:
     """Load documents from files using Anyparser API."""
 
+    __slots__ = ("file_path", "format", "model", "cache", "options", "_parser")
+
+    #: Maximum number of parsed files kept in the result cache
+    cache_maxsize: int = 128
+
     def __init__(
         self,
         file_path: Optional[str] = None,
@@ -41,6 +64,7 @@ class AnyparserLoader:
         max_executions: Optional[int] = None,
         strategy: Optional[Literal["LIFO", "FIFO"]] = None,
         traversal_scope: Optional[Literal["subtree", "domain"]] = None,
+        cache: bool = False,
         **kwargs,
     ) -> None:
         """Initialize the AnyparserLoader.
@@ -61,6 +85,7 @@ class AnyparserLoader:
             max_executions (Optional[int], optional): Maximum pages to crawl. Defaults to None.
             strategy (Optional[Literal["LIFO", "FIFO"]], optional): Crawling strategy. Defaults to None.
             traversal_scope (Optional[Literal["subtree", "domain"]], optional): Crawling scope. Defaults to None.
+            cache (bool, optional): Reuse the documents of the file while its content is unchanged. Defaults to False.
             **kwargs: Additional arguments to pass to Anyparser
 
         Raises:
@@ -76,6 +101,7 @@ class AnyparserLoader:
         self.file_path = url if model == "crawler" else file_path
         self.format = format
         self.model = model
+        self.cache = cache
 
         # Initialize Anyparser options
         self.options = AnyparserOption(
@@ -97,8 +123,133 @@ class AnyparserLoader:
             **kwargs,
         )
 
-        # Initialize parser
-        self.parser = Anyparser(options=self.options)
+        # The parser is created on first use
+        self._parser: Optional[Anyparser] = None
+
+    @property
+    def parser(self) -> Anyparser:
+        """The Anyparser instance used by the loader, created on first access."""
+        if self._parser is None:
+            self._parser = Anyparser(options=self.options)
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser: Anyparser) -> None:
+        self._parser = parser
+
+    @classmethod
+    def from_shared(
+        cls,
+        parser: Anyparser,
+        file_path: str,
+        format: Optional[Literal["json", "markdown", "html"]] = None,
+        model: Optional[Literal["text", "ocr", "vlm", "lam", "crawler"]] = None,
+        cache: bool = False,
+    ) -> "AnyparserLoader":
+        """Create a loader that reuses an already configured Anyparser instance.
+
+        Unlike the regular constructor, no options or parser are built, so many
+        loaders can share a single parser.
+
+        Args:
+            parser (Anyparser): The parser to share between loaders
+            file_path (str): Path to the local file to be parsed
+            format (Optional[str], optional): Output format. Defaults to the parser's format.
+            model (Optional[str], optional): Processing model. Defaults to the parser's model.
+            cache (bool, optional): Reuse the documents of previously parsed files. Defaults to False.
+
+        Returns:
+            AnyparserLoader: A loader bound to the shared parser
+        """
+        # A parser built without options uses the AnyparserOption defaults
+        options = parser.options or AnyparserOption()
+
+        loader = cls.__new__(cls)
+        loader.file_path = file_path
+        loader.format = options.format if format is None else format
+        loader.model = options.model if model is None else model
+        loader.cache = cache
+        loader.options = options
+        loader._parser = parser
+        return loader
+
+    @classmethod
+    async def aload_many(
+        cls,
+        file_paths: List[str],
+        anyparser_api_key: Optional[str] = None,
+        anyparser_api_url: Optional[str] = None,
+        format: Literal["json", "markdown", "html"] = "markdown",
+        model: Literal["text", "ocr", "vlm", "lam"] = "text",
+        max_concurrency: int = 8,
+        cache: bool = False,
+        **kwargs,
+    ) -> List[Document]:
+        """Asynchronously load and parse several files with a single Anyparser instance.
+
+        The options and parser are built once and shared by every file, and at
+        most ``max_concurrency`` files are parsed at the same time.
+
+        Args:
+            file_paths (List[str]): Paths to the local files to be parsed.
+            anyparser_api_key (Optional[str], optional): Your Anyparser API key. Defaults to None.
+            anyparser_api_url (Optional[str], optional): Your Anyparser API URL. Defaults to None.
+            format (str, optional): Output format. Defaults to "markdown".
+            model (str, optional): Processing model. Defaults to "text".
+            max_concurrency (int, optional): Maximum number of files parsed at once. Defaults to 8.
+            cache (bool, optional): Reuse the documents of previously parsed files. Defaults to False.
+            **kwargs: Additional arguments to pass to Anyparser
+
+        Returns:
+            List[Document]: List of parsed documents, in the order of file_paths
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1. Errors of a failed
+                file are re-raised after the other pending files are cancelled.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        options = AnyparserOption(
+            api_key=anyparser_api_key,
+            api_url=anyparser_api_url,
+            format=format,
+            model=model,
+            **kwargs,
+        )
+        parser = Anyparser(options=options)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _load(file_path: str) -> List[Document]:
+            async with semaphore:
+                loader = cls.from_shared(parser, file_path, format, model, cache)
+                return await loader.aload()
+
+        tasks = [asyncio.create_task(_load(path)) for path in file_paths]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining parses instead of leaving them running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return list(chain.from_iterable(results))
+
+    def _create_document_from_string(self, content: str) -> Document:
+        """Create a Document from a markdown or html result.
+
+        Args:
+            content (str): The markdown or html returned by Anyparser
+
+        Returns:
+            Document: A LangChain Document with content and metadata
+        """
+        return Document(
+            page_content=content,
+            metadata={"source": self.file_path, "format": self.format},
+        )
 
     def _create_document_from_url(
         self, url_result: AnyparserUrl, page_number: int = 1, total_pages: int = 1
@@ -113,6 +264,8 @@ class AnyparserLoader:
         Returns:
             Document: A LangChain Document with content and metadata
         """
+        images = url_result.images or ()
+
         return Document(
             page_content=url_result.markdown or url_result.text or "",
             metadata={
@@ -127,18 +280,14 @@ class AnyparserLoader:
                 "politeness_delay": url_result.politeness_delay,
                 "total_characters": url_result.total_characters,
                 "crawled_at": url_result.crawled_at,
-                "images": (
-                    [
-                        {
-                            "name": img.display_name,
-                            "index": img.image_index,
-                            "page": img.page,
-                        }
-                        for img in url_result.images
-                    ]
-                    if url_result.images
-                    else []
-                ),
+                "images": [
+                    {
+                        "name": img.display_name,
+                        "index": img.image_index,
+                        "page": img.page,
+                    }
+                    for img in images
+                ],
             },
         )
 
@@ -154,56 +303,193 @@ class AnyparserLoader:
         Returns:
             List[Document]: List of LangChain Documents
         """
-        documents = []
-
-        if isinstance(result, AnyparserCrawlResult):
-            # Handle crawler results
-            total_pages = len(result.items)
-            for i, item in enumerate(result.items, 1):
-                documents.append(self._create_document_from_url(item, i, total_pages))
-        elif isinstance(result, AnyparserPdfResult):
-            # Handle PDF results
-            total_pages = len(result.items)
-            for i, page in enumerate(result.items, 1):
-                documents.append(
-                    Document(
-                        page_content=page.markdown or page.text or "",
-                        metadata={
-                            "source": self.file_path,
-                            "format": self.format,
-                            "page_number": page.page_number,
-                            "total_pages": total_pages,
-                            "rid": result.rid,
-                            "checksum": result.checksum,
-                            "total_characters": result.total_characters,
-                            "original_filename": result.original_filename,
-                            "images": page.images if page.images else [],
-                        },
-                    )
-                )
-        else:
-            # Handle basic results
-            documents.append(
-                Document(
-                    page_content=result.markdown or "",
-                    metadata={
-                        "source": self.file_path,
-                        "format": self.format,
-                        "rid": result.rid,
-                        "checksum": result.checksum,
-                        "total_characters": result.total_characters,
-                        "original_filename": result.original_filename,
-                    },
-                )
+        return list(self._iter_documents_from_result(result))
+
+    def _iter_documents_from_result(
+        self,
+        result: Union[AnyparserResultBase, AnyparserPdfResult, AnyparserCrawlResult],
+    ) -> Iterator[Document]:
+        """Lazily create Documents from an Anyparser result, one page at a time.
+
+        Args:
+            result: The result from Anyparser (any type)
+
+        Returns:
+            Iterator[Document]: A LangChain Document per crawled page, PDF page or file
+        """
+        method_name = self._RESULT_HANDLERS.get(type(result))
+        if method_name is None:
+            # Subclasses of the known result types fall back to isinstance checks
+            method_name = next(
+                (
+                    name
+                    for result_type, name in self._RESULT_HANDLERS.items()
+                    if isinstance(result, result_type)
+                ),
+                "_from_base_result",
+            )
+
+        # Resolved on the instance so subclasses can override the handlers
+        return getattr(self, method_name)(result)
+
+    def _iter_documents(
+        self,
+        results: List[
+            Union[AnyparserResultBase, AnyparserPdfResult, AnyparserCrawlResult]
+        ],
+    ) -> Iterator[Document]:
+        """Lazily create Documents from the results of a JSON format parse.
+
+        Args:
+            results: The list of results from Anyparser
+
+        Returns:
+            Iterator[Document]: The Documents of every result, in order
+
+        Raises:
+            ValueError: If a result is malformed and cannot be converted
+        """
+        try:
+            for result in results:
+                yield from self._iter_documents_from_result(result)
+        except (AttributeError, TypeError, KeyError, ValueError) as e:
+            raise ValueError(f"Error parsing document with Anyparser: {str(e)}") from e
+
+    def _from_crawl_result(self, result: AnyparserCrawlResult) -> Iterator[Document]:
+        """Lazily create a Document per crawled page."""
+        create_document = self._create_document_from_url
+        total_pages = len(result.items)
+        for i, item in enumerate(result.items, 1):
+            yield create_document(item, i, total_pages)
+
+    def _from_pdf_result(self, result: AnyparserPdfResult) -> Iterator[Document]:
+        """Lazily create a Document per PDF page."""
+        # Metadata common to all pages
+        common_metadata = {
+            "source": self.file_path,
+            "format": self.format,
+            "total_pages": len(result.items),
+            "rid": result.rid,
+            "checksum": result.checksum,
+            "total_characters": result.total_characters,
+            "original_filename": result.original_filename,
+        }
+        for page in result.items:
+            yield Document(
+                page_content=page.markdown or page.text or "",
+                metadata={
+                    **common_metadata,
+                    "page_number": page.page_number,
+                    "images": page.images or [],
+                },
             )
 
-        return documents
+    def _from_base_result(self, result: AnyparserResultBase) -> Iterator[Document]:
+        """Lazily create the single Document of a basic result."""
+        yield Document(
+            page_content=result.markdown or "",
+            metadata={
+                "source": self.file_path,
+                "format": self.format,
+                "rid": result.rid,
+                "checksum": result.checksum,
+                "total_characters": result.total_characters,
+                "original_filename": result.original_filename,
+            },
+        )
+
+    # Result type to the name of its document factory; subclasses must come before their bases
+    _RESULT_HANDLERS = {
+        AnyparserCrawlResult: "_from_crawl_result",
+        AnyparserPdfResult: "_from_pdf_result",
+        AnyparserResultBase: "_from_base_result",
+    }
+
+    async def _cache_key(self) -> Optional[Tuple[str, str, str]]:
+        """Build the result cache key of the loader's file.
+
+        The file is hashed in a worker thread so large files do not block the event loop.
+
+        Returns:
+            Optional[Tuple[str, str, str]]: The file path, the SHA-256 of its content and the parser
+            options without the API key, or None when caching is disabled or the source is not a local file
+        """
+        if not self.cache or self.model == "crawler" or self.file_path is None:
+            return None
+        if not os.path.isfile(self.file_path):
+            return None
+
+        digest = await asyncio.to_thread(_file_digest, self.file_path)
+        options = tuple(
+            (field.name, getattr(self.options, field.name))
+            for field in dataclasses.fields(self.options)
+            if field.name != "api_key"
+        )
+
+        return self.file_path, digest, repr(options)
 
     async def aload(self) -> List[Document]:
         """Asynchronously load and parse the file with Anyparser.
 
         Returns:
             List[Document]: List of parsed documents with their metadata
+
+        Raises:
+            ValueError: If the options or the result are invalid
+        """
+        return [document async for document in self.alazy_load()]
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Asynchronously load and parse the file with Anyparser, one document at a time.
+
+        Crawled pages and PDF pages are turned into Documents only as they are
+        consumed, so callers can process each one before the next is built.
+
+        Yields:
+            Document: Parsed documents with their metadata
+
+        Raises:
+            ValueError: If the options or the result are invalid
+        """
+        cache_key = await self._cache_key()
+        if cache_key is not None and cache_key in _RESULT_CACHE:
+            _RESULT_CACHE.move_to_end(cache_key)
+            for document in copy.deepcopy(_RESULT_CACHE[cache_key]):
+                yield document
+            return
+
+        result = await self._parse()
+
+        # For markdown/html format, result is a string
+        if isinstance(result, str):
+            documents = [self._create_document_from_string(result)]
+        else:
+            documents = self._iter_documents(result)
+
+        cached = []
+        for document in documents:
+            if cache_key is not None:
+                cached.append(copy.deepcopy(document))
+            yield document
+
+        if cache_key is not None:
+            _RESULT_CACHE[cache_key] = cached
+            while len(_RESULT_CACHE) > self.cache_maxsize:
+                _RESULT_CACHE.popitem(last=False)
+
+    async def _parse(
+        self,
+    ) -> Union[
+        str, List[Union[AnyparserResultBase, AnyparserPdfResult, AnyparserCrawlResult]]
+    ]:
+        """Parse the file with Anyparser and check the result matches the format.
+
+        Returns:
+            A string for markdown/html format, or a list of Anyparser results for JSON format
+
+        Raises:
+            ValueError: If the options or the result are invalid. Network, HTTP and
+                file system errors are raised unchanged so callers can retry on them.
         """
         try:
             # Parse the document
@@ -215,24 +501,16 @@ class AnyparserLoader:
                     raise ValueError(
                         f"Expected string for {self.format} format, got: {type(result)}"
                     )
-                return [
-                    Document(
-                        page_content=result,
-                        metadata={"source": self.file_path, "format": self.format},
-                    )
-                ]
+                return result
 
             # For JSON format, result is a list of AnyparserResult
             if not isinstance(result, list):
                 raise ValueError(f"Expected list for JSON format, got: {type(result)}")
 
-            documents = []
-            for item in result:
-                documents.extend(self._create_document_from_result(item))
-            return documents
+            return result
 
-        except Exception as e:
-            raise ValueError(f"Error parsing document with Anyparser: {str(e)}")
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Error parsing document with Anyparser: {str(e)}") from e
 
     def load(self) -> List[Document]:
         """Synchronously load and parse the file with Anyparser.
@@ -240,7 +518,13 @@ class AnyparserLoader:
 
         Returns:
             List[Document]: List of parsed documents with their metadata
+
+        Raises:
+            RuntimeError: If called while an event loop is already running
         """
-        loop = asyncio.get_event_loop()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aload())
 
-        return loop.run_until_complete(self.aload())
+        raise RuntimeError("Use aload() from within an async context")
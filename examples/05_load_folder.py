@@ -1,43 +1,19 @@
 """Example: Load all files from a folder."""
 
 import asyncio
+import hashlib
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
+from _utils import print_documents
 from langchain_core.documents import Document
 
 from anyparser_langchain import AnyparserLoader
 
 
-def print_documents(documents: List[Document]) -> None:
-    """Print documents and their metadata."""
-    print(f"\nTotal documents: {len(documents)}")
-    print("=" * 50)
-
-    for i, doc in enumerate(documents, 1):
-        print(f"\nDocument {i}:")
-        print("=" * 50)
-
-        # Print URL info if available
-        if "url" in doc.metadata:
-            print(f"URL: {doc.metadata['url']}")
-        if "title" in doc.metadata:
-            print(f"Title: {doc.metadata['title']}")
-        if "status_message" in doc.metadata:
-            print(f"Status: {doc.metadata['status_message']}")
-
-        # Print content preview
-        print(f"\nContent (first 500 characters):\n{doc.page_content[:500]}")
-
-        # Print other metadata
-        print("\nMetadata:")
-        for key, value in doc.metadata.items():
-            if key not in ["url", "title", "status_message"]:
-                print(f"{key}: {value}")
-        print("=" * 50)
-
-
 async def main():
     """Load all files from a folder (max 5 files)."""
     api_key = os.getenv("ANYPARSER_API_KEY")
@@ -46,18 +22,39 @@ async def main():
     # Get all files from docs directory
     docs_dir = Path("docs")
     files = list(docs_dir.glob("*"))[:5]  # Limit to 5 files
-    all_documents = []
 
-    for file_path in files:
-        loader = AnyparserLoader(
-            file_path=str(file_path),
-            anyparser_api_key=api_key,
-            anyparser_api_url=api_url,
-            format="markdown",
-            model="text",
+    # Hash the files in parallel so identical contents are uploaded only once
+    with ThreadPoolExecutor() as executor:
+        hashes = list(
+            executor.map(
+                lambda path: hashlib.sha256(path.read_bytes()).hexdigest(), files
+            )
+        )
+
+    paths_by_hash: Dict[str, List[Path]] = defaultdict(list)
+    for file_hash, file_path in zip(hashes, files):
+        paths_by_hash[file_hash].append(file_path)
+    copies = {str(paths[0]): paths for paths in paths_by_hash.values()}
+
+    # Parse the distinct files concurrently with a single shared parser
+    documents = await AnyparserLoader.aload_many(
+        list(copies),
+        anyparser_api_key=api_key,
+        anyparser_api_url=api_url,
+        format="markdown",
+        model="text",
+        max_concurrency=8,
+    )
+
+    # Give every copy of a file its own documents
+    all_documents = [
+        Document(
+            page_content=doc.page_content,
+            metadata={**doc.metadata, "source": str(file_path)},
         )
-        documents = await loader.aload()
-        all_documents.extend(documents)
+        for doc in documents
+        for file_path in copies[doc.metadata["source"]]
+    ]
 
     print_documents(all_documents)
 
@@ -3,41 +3,12 @@
 import asyncio
 import os
 import traceback
-from typing import List
 
-from langchain_core.documents import Document
+from _utils import print_documents, serialize_metadata
 
 from anyparser_langchain import AnyparserLoader
 
 
-def print_documents(documents: List[Document]) -> None:
-    """Print documents and their metadata."""
-    print(f"\nTotal documents: {len(documents)}")
-    print("=" * 50)
-
-    for i, doc in enumerate(documents, 1):
-        print(f"\nDocument {i}:")
-        print("=" * 50)
-
-        # Print URL info if available
-        if "url" in doc.metadata:
-            print(f"URL: {doc.metadata['url']}")
-        if "title" in doc.metadata:
-            print(f"Title: {doc.metadata['title']}")
-        if "status_message" in doc.metadata:
-            print(f"Status: {doc.metadata['status_message']}")
-
-        # Print content preview
-        print(f"\nContent (first 500 characters):\n{doc.page_content[:500]}")
-
-        # Print other metadata
-        print("\nMetadata:")
-        for key, value in doc.metadata.items():
-            if key not in ["url", "title", "status_message"]:
-                print(f"{key}: {value}")
-        print("=" * 50)
-
-
 async def main():
     """Crawl website with JSON output to get multiple pages."""
     try:
@@ -59,6 +30,12 @@ async def main():
         documents = await loader.aload()
         print_documents(documents)
 
+        # Save the metadata of every crawled page as JSON Lines
+        with open("crawler_metadata.jsonl", "wb") as file:
+            for doc in documents:
+                file.write(serialize_metadata(doc) + b"\n")
+        print("\nMetadata saved to crawler_metadata.jsonl")
+
     except Exception as e:
         print("\nError occurred:")
         print("=" * 50)
@@ -0,0 +1,59 @@
+"""Shared helpers for the examples."""
+
+import json
+import sys
+from typing import List
+
+from langchain_core.documents import Document
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Metadata keys printed in the header of each document
+_PRINTED_KEYS = frozenset({"url", "title", "status_message"})
+
+# Marks header keys absent from the metadata; None values are still printed
+_MISSING = object()
+
+
+def print_documents(documents: List[Document]) -> None:
+    """Print documents and their metadata."""
+    lines = [f"\nTotal documents: {len(documents)}", "=" * 50]
+
+    for i, doc in enumerate(documents, 1):
+        lines.append(f"\nDocument {i}:")
+        lines.append("=" * 50)
+
+        # Print URL info if available
+        metadata = doc.metadata
+        if (url := metadata.get("url", _MISSING)) is not _MISSING:
+            lines.append(f"URL: {url}")
+        if (title := metadata.get("title", _MISSING)) is not _MISSING:
+            lines.append(f"Title: {title}")
+        if (status := metadata.get("status_message", _MISSING)) is not _MISSING:
+            lines.append(f"Status: {status}")
+
+        # Print content preview
+        lines.append(f"\nContent (first 500 characters):\n{doc.page_content[:500]}")
+
+        # Print other metadata
+        lines.append("\nMetadata:")
+        lines.extend(
+            f"{key}: {value}"
+            for key, value in metadata.items()
+            if key not in _PRINTED_KEYS
+        )
+        lines.append("=" * 50)
+
+    # Write everything at once rather than one print() call per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def serialize_metadata(doc: Document) -> bytes:
+    """Serialize document metadata to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(doc.metadata, default=str)
+    return json.dumps(doc.metadata, default=str, separators=(",", ":")).encode()
@@ -1,20 +1,24 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import http.client
+from contextlib import contextmanager
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from anyparser_core import (
-    AnyparserCrawlDirective,
+    Anyparser,
     AnyparserCrawlResult,
+    AnyparserImageReference,
+    AnyparserOption,
     AnyparserPdfPage,
     AnyparserPdfResult,
     AnyparserResultBase,
-    AnyparserRobotsTxtDirective,
     AnyparserUrl,
-    OcrLanguage,
-    OCRPreset,
 )
 from langchain_core.documents import Document
 
-from anyparser_langchain import AnyparserLoader
+import anyparser_langchain
+from anyparser_langchain import _RESULT_CACHE, AnyparserLoader
 
 
 def mock_anyparser_result(result_type, format="json", **kwargs):
@@ -29,110 +33,316 @@ def mock_anyparser_result(result_type, format="json", **kwargs):
     return []
 
 
-def mock_anyparser_url_result(**kwargs):
-    default_kwargs = {
+# Directive placeholders; the loader never reads them
+_CRAWL_DIRECTIVE = SimpleNamespace()
+_ROBOTS_DIRECTIVE = SimpleNamespace()
+
+# Read-only default arguments of the mock result builders
+_URL_DEFAULTS = MappingProxyType(
+    {
         "url": "http://example.com/page1",
         "status_code": 200,
         "status_message": "OK",
         "politeness_delay": 100,
         "total_characters": 100,
         "markdown": None,  # Default markdown to None
-        "directive": MagicMock(spec=AnyparserCrawlDirective),  # Mock directive
+        "directive": _CRAWL_DIRECTIVE,
         "title": "Page 1",
         "crawled_at": "now",
-        "images": [],
+        "images": (),
         "text": "page 1 content",
     }
-    updated_kwargs = default_kwargs.copy()
-    updated_kwargs.update(kwargs)  # Update a copy to avoid modifying defaults
-    return AnyparserUrl(**updated_kwargs)
-
+)
 
-def mock_anyparser_pdf_result(**kwargs):
-    default_kwargs = {
+_PDF_DEFAULTS = MappingProxyType(
+    {
         "rid": "test_rid",
         "original_filename": "test.pdf",
         "checksum": "test_checksum",
         "total_characters": 200,
         "total_items": 2,
         "markdown": "pdf result markdown",
-        "items": [],  # Will be populated in tests
+        "items": (),  # Will be populated in tests
     }
-    updated_kwargs = default_kwargs.copy()
-    updated_kwargs.update(kwargs)
-    return AnyparserPdfResult(**updated_kwargs)
-
+)
 
-def mock_anyparser_pdf_page_result(**kwargs):  # New mock for PDF page results
-    default_kwargs = {
+_PDF_PAGE_DEFAULTS = MappingProxyType(
+    {
         "page_number": 1,
         "text": "pdf page content",
         "markdown": "pdf page content",
-        "images": [],
+        "images": (),
     }
-    updated_kwargs = default_kwargs.copy()
-    updated_kwargs.update(kwargs)
-    return AnyparserPdfPage(**updated_kwargs)  # Returns AnyparserPdfPage
-
+)
 
-def mock_anyparser_base_result(**kwargs):
-    default_kwargs = {
+_BASE_DEFAULTS = MappingProxyType(
+    {
         "rid": "test_rid",
         "original_filename": "test.pdf",
         "checksum": "test_checksum",
-        "total_characters": 100,  # Added default value
-        "markdown": "base content",  # Added default value
+        "total_characters": 100,
+        "markdown": "base content",
     }
-    updated_kwargs = default_kwargs.copy()
-    updated_kwargs.update(kwargs)
-    return AnyparserResultBase(**updated_kwargs)
-
+)
 
-def mock_anyparser_crawl_result(**kwargs):
-    default_kwargs = {
+_CRAWL_DEFAULTS = MappingProxyType(
+    {
         "rid": "test_rid",
         "start_url": "http://example.com",
         "total_characters": 1000,
-        "total_items": 2,  # Corrected to 2 for tests
+        "total_items": 2,
         "markdown": "crawl result markdown",
-        "robots_directive": MagicMock(
-            spec=AnyparserRobotsTxtDirective
-        ),  # Mock robots_directive
-        "items": [],  # Will be populated in tests
+        "robots_directive": _ROBOTS_DIRECTIVE,
+        "items": (),  # Will be populated in tests
     }
-    updated_kwargs = default_kwargs.copy()
-    updated_kwargs.update(kwargs)
-    return AnyparserCrawlResult(**updated_kwargs)
+)
 
 
-@pytest.fixture
+def mock_anyparser_url_result(**kwargs):
+    return AnyparserUrl(**{**_URL_DEFAULTS, **kwargs})
+
+
+def mock_anyparser_pdf_result(**kwargs):
+    return AnyparserPdfResult(**{**_PDF_DEFAULTS, **kwargs})
+
+
+def mock_anyparser_pdf_page_result(**kwargs):
+    return AnyparserPdfPage(**{**_PDF_PAGE_DEFAULTS, **kwargs})
+
+
+def mock_anyparser_base_result(**kwargs):
+    return AnyparserResultBase(**{**_BASE_DEFAULTS, **kwargs})
+
+
+def mock_anyparser_crawl_result(**kwargs):
+    return AnyparserCrawlResult(**{**_CRAWL_DEFAULTS, **kwargs})
+
+
+@contextmanager
+def swap_anyparser(fake):
+    real = anyparser_langchain.Anyparser
+    anyparser_langchain.Anyparser = fake
+    try:
+        yield fake
+    finally:
+        anyparser_langchain.Anyparser = real
+
+
+@pytest.fixture(scope="module")
 def mock_anyparser():
-    with patch("anyparser_langchain.Anyparser") as MockAnyparser:
+    with swap_anyparser(MagicMock()) as MockAnyparser:
         yield MockAnyparser
 
 
+# A single AsyncMock reused as parse() by every test
+_PARSE_MOCK = AsyncMock()
+
+
+@pytest.fixture
+def make_parse_mock():
+    def _make(return_value=None, side_effect=None):
+        _PARSE_MOCK.reset_mock(return_value=True, side_effect=True)
+        _PARSE_MOCK.return_value = return_value
+        _PARSE_MOCK.side_effect = side_effect
+        return _PARSE_MOCK
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_anyparser(mock_anyparser, make_parse_mock):
+    mock_anyparser.reset_mock(return_value=True, side_effect=True)
+    mock_anyparser.return_value.parse = make_parse_mock()
+
+
+@pytest.fixture(scope="session")
+def loaders():
+    return {
+        "file": AnyparserLoader(file_path="test.pdf"),
+        "crawl": AnyparserLoader(url="http://example.com", model="crawler"),
+    }
+
+
+@pytest.fixture
+def result_cache():
+    _RESULT_CACHE.clear()
+    yield _RESULT_CACHE
+    _RESULT_CACHE.clear()
+
+
+EXPECTED_BASE_META = {
+    "source": "test.pdf",
+    "format": "json",
+    "rid": "test_rid",
+    "checksum": "test_checksum",
+    "total_characters": 100,
+    "original_filename": "test.pdf",
+}
+
+EXPECTED_PDF_META = {
+    "source": "test.pdf",
+    "format": "json",
+    "page_number": 1,
+    "total_pages": 2,
+    # Defaults from mock_anyparser_pdf_result
+    "rid": "test_rid",
+    "checksum": "test_checksum",
+    "total_characters": 200,
+    "original_filename": "test.pdf",
+    "images": [],
+}
+
+EXPECTED_URL_META = {
+    "source": "http://example.com/page1",
+    "format": "json",
+    "page_number": 1,
+    "total_pages": 2,
+    "url": "http://example.com/page1",
+    "title": "Page 1",
+    "status_message": "OK",
+    "status_code": 200,
+    "politeness_delay": 100,
+    "total_characters": 100,
+    "crawled_at": "now",
+    "images": [],
+}
+
+# (result builder, loader arguments, expected documents)
+JSON_CASES = [
+    pytest.param(
+        lambda: [mock_anyparser_base_result(markdown="test markdown content")],
+        {"file_path": "test.pdf"},
+        [Document(page_content="test markdown content", metadata=EXPECTED_BASE_META)],
+        id="base",
+    ),
+    pytest.param(
+        lambda: [
+            mock_anyparser_pdf_result(
+                items=[
+                    mock_anyparser_pdf_page_result(
+                        markdown="page 1 content", page_number=1
+                    ),
+                    mock_anyparser_pdf_page_result(
+                        markdown="page 2 content", page_number=2
+                    ),
+                ],
+            )
+        ],
+        {"file_path": "test.pdf"},
+        [
+            Document(page_content="page 1 content", metadata=EXPECTED_PDF_META),
+            Document(
+                page_content="page 2 content",
+                metadata={**EXPECTED_PDF_META, "page_number": 2},
+            ),
+        ],
+        id="pdf",
+    ),
+    pytest.param(
+        lambda: [
+            mock_anyparser_crawl_result(
+                items=[
+                    mock_anyparser_url_result(
+                        url="http://example.com/page1",
+                        markdown="page 1 content",
+                        title="Page 1",
+                        status_message="OK",
+                        status_code=200,
+                        politeness_delay=100,
+                        total_characters=100,
+                        crawled_at="now",
+                    ),
+                    mock_anyparser_url_result(
+                        url="http://example.com/page2",
+                        markdown="page 2 content",
+                        title="Page 2",
+                        status_message="OK",
+                        status_code=200,
+                        politeness_delay=100,
+                        total_characters=100,
+                        crawled_at="now",
+                    ),
+                ]
+            )
+        ],
+        {"url": "http://example.com", "model": "crawler"},
+        [
+            Document(page_content="page 1 content", metadata=EXPECTED_URL_META),
+            Document(
+                page_content="page 2 content",
+                metadata={
+                    **EXPECTED_URL_META,
+                    "source": "http://example.com/page2",
+                    "page_number": 2,
+                    "url": "http://example.com/page2",
+                    "title": "Page 2",
+                },
+            ),
+        ],
+        id="crawl",
+    ),
+]
+
+
 class TestAnyparserLoader:
-    def test_initialization_file_path(self):
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            pytest.param(
+                {"file_path": "test.pdf"},
+                {"file_path": "test.pdf", "url": None},
+                id="file_path",
+            ),
+            pytest.param(
+                {"url": "http://example.com", "model": "crawler"},
+                {"file_path": "http://example.com", "url": "http://example.com"},
+                id="url",
+            ),
+            pytest.param(
+                {},
+                "Either file_path or url must be provided",
+                id="invalid_no_input",
+            ),
+            pytest.param(
+                {"file_path": "test.pdf", "url": "http://example.com"},
+                "Only one of file_path or url should be provided",
+                id="invalid_both_inputs",
+            ),
+        ],
+    )
+    def test_initialization(self, kwargs, expected):
+        if isinstance(expected, str):
+            with pytest.raises(ValueError, match=expected):
+                AnyparserLoader(**kwargs)
+            return
+
+        loader = AnyparserLoader(**kwargs)
+        assert loader.file_path == expected["file_path"]
+        assert loader.options.url == expected["url"]
+
+    def test_initialization_has_no_instance_dict(self):
         loader = AnyparserLoader(file_path="test.pdf")
-        assert loader.file_path == "test.pdf"
-        assert loader.options.url is None
-
-    def test_initialization_url(self):
-        loader = AnyparserLoader(url="http://example.com", model="crawler")
-        assert loader.file_path == "http://example.com"
-        assert loader.options.url == "http://example.com"
+        assert not hasattr(loader, "__dict__")
+        with pytest.raises(AttributeError):
+            loader.unknown_attribute = True
 
-    def test_initialization_invalid_no_input(self):
-        with pytest.raises(ValueError) as excinfo:
-            AnyparserLoader()
-        assert "Either file_path or url must be provided" in str(excinfo.value)
+    def test_parser_created_lazily(self, mock_anyparser):
+        loader = AnyparserLoader(file_path="test.pdf")
+        mock_anyparser.assert_not_called()
+        parser = loader.parser
+        assert loader.parser is parser
+        mock_anyparser.assert_called_once_with(options=loader.options)
 
-    def test_initialization_invalid_both_inputs(self):
-        with pytest.raises(ValueError) as excinfo:
-            AnyparserLoader(file_path="test.pdf", url="http://example.com")
-        assert "Only one of file_path or url should be provided" in str(excinfo.value)
+    def test_parser_assignment(self, mock_anyparser):
+        loader = AnyparserLoader(file_path="test.pdf")
+        custom_parser = MagicMock()
+        loader.parser = custom_parser
+        assert loader.parser is custom_parser
+        mock_anyparser.assert_not_called()
 
     def test_initialization_options_forwarding(self):
+        from anyparser_core import OcrLanguage, OCRPreset
+
         loader = AnyparserLoader(
             file_path="test.pdf",
             anyparser_api_key="test_key",
@@ -164,202 +374,21 @@ class TestAnyparserLoader:
         assert options.strategy == "FIFO"
         assert options.traversal_scope == "domain"
 
-    @pytest.mark.asyncio
-    async def test_aload_markdown_format(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(
-            return_value="mocked markdown content"
-        )  # AsyncMock
-        loader = AnyparserLoader(file_path="test.pdf", format="markdown")
-        docs = await loader.aload()
-        mock_instance.parse.assert_called_once_with("test.pdf")
-        assert len(docs) == 1
-        assert docs[0].page_content == "mocked markdown content"
-        assert docs[0].metadata["source"] == "test.pdf"
-        assert docs[0].metadata["format"] == "markdown"
-
-    @pytest.mark.asyncio
-    async def test_aload_html_format(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(return_value="mocked html content")  # AsyncMock
-        loader = AnyparserLoader(file_path="test.pdf", format="html")
-        docs = await loader.aload()
-        mock_instance.parse.assert_called_once_with("test.pdf")
-        assert len(docs) == 1
-        assert docs[0].page_content == "mocked html content"
-        assert docs[0].metadata["source"] == "test.pdf"
-        assert docs[0].metadata["format"] == "html"
+    def test__create_document_from_string(self, loaders):
+        doc = loaders["file"]._create_document_from_string("mocked markdown content")
+        assert doc.page_content == "mocked markdown content"
+        assert doc.metadata == {"source": "test.pdf", "format": "markdown"}
 
-    @pytest.mark.asyncio
-    async def test_aload_json_format_base_result(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_result = mock_anyparser_base_result(
-            markdown="test markdown content",
-        )
-        mock_instance.parse = AsyncMock(return_value=[mock_result])  # AsyncMock
-        loader = AnyparserLoader(file_path="test.pdf", format="json")
-        docs = await loader.aload()
-        mock_instance.parse.assert_called_once_with("test.pdf")
-        assert len(docs) == 1
-        doc = docs[0]
-        assert doc.page_content == "test markdown content"
-        assert doc.metadata["source"] == "test.pdf"
-        assert doc.metadata["format"] == "json"
-        assert doc.metadata["rid"] == "test_rid"
-        assert doc.metadata["checksum"] == "test_checksum"
-        assert doc.metadata["total_characters"] == 100
-        assert doc.metadata["original_filename"] == "test.pdf"
-
-    @pytest.mark.asyncio
-    async def test_aload_json_format_pdf_result(self, mock_anyparser):
+    def test_load_runs_event_loop(self, mock_anyparser, make_parse_mock):
         mock_instance = mock_anyparser.return_value
-        mock_result = mock_anyparser_pdf_result(
-            items=[
-                mock_anyparser_pdf_page_result(
-                    markdown="page 1 content", page_number=1
-                ),  # Using pdf page mock, page_number added
-                mock_anyparser_pdf_page_result(
-                    markdown="page 2 content", page_number=2
-                ),  # Using pdf page mock, page_number added
-            ],
-        )
-        mock_instance.parse = AsyncMock(return_value=[mock_result])  # AsyncMock
-        loader = AnyparserLoader(file_path="test.pdf", format="json")
-        docs = await loader.aload()
-        mock_instance.parse.assert_called_once_with("test.pdf")
-        assert len(docs) == 2
-        doc1 = docs[0]
-        assert doc1.page_content == "page 1 content"
-        assert doc1.metadata["source"] == "test.pdf"
-        assert doc1.metadata["format"] == "json"
-        assert doc1.metadata["page_number"] == 1
-        assert doc1.metadata["total_pages"] == 2
-        assert (
-            doc1.metadata["rid"] == "test_rid"
-        )  # default from mock_anyparser_pdf_result
-        assert (
-            doc1.metadata["checksum"] == "test_checksum"
-        )  # default from mock_anyparser_pdf_result
-        assert (
-            doc1.metadata["total_characters"] == 200
-        )  # default from mock_anyparser_pdf_result
-        assert (
-            doc1.metadata["original_filename"] == "test.pdf"
-        )  # default from mock_anyparser_pdf_result
-
-        doc2 = docs[1]
-        assert doc2.page_content == "page 2 content"
-        assert doc2.metadata["page_number"] == 2
-
-    @pytest.mark.asyncio
-    async def test_aload_json_format_crawl_result(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_result = mock_anyparser_crawl_result(
-            items=[
-                mock_anyparser_url_result(
-                    url="http://example.com/page1",
-                    markdown="page 1 content",
-                    title="Page 1",
-                    status_message="OK",
-                    status_code=200,
-                    politeness_delay=100,
-                    total_characters=100,
-                    crawled_at="now",
-                ),
-                mock_anyparser_url_result(
-                    url="http://example.com/page2",
-                    markdown="page 2 content",
-                    title="Page 2",
-                    status_message="OK",
-                    status_code=200,
-                    politeness_delay=100,
-                    total_characters=100,
-                    crawled_at="now",
-                ),
-            ]
-        )
-        mock_instance.parse = AsyncMock(return_value=[mock_result])  # AsyncMock
-        loader = AnyparserLoader(
-            url="http://example.com", model="crawler", format="json"
-        )
-        docs = await loader.aload()
-        mock_instance.parse.assert_called_once_with("http://example.com")
-        assert len(docs) == 2
-        doc1 = docs[0]
-        assert doc1.page_content == "page 1 content"
-        assert doc1.metadata["source"] == "http://example.com/page1"
-        assert doc1.metadata["format"] == "json"
-        assert doc1.metadata["page_number"] == 1
-        assert doc1.metadata["total_pages"] == 2
-        assert doc1.metadata["url"] == "http://example.com/page1"
-        assert doc1.metadata["title"] == "Page 1"
-        assert doc1.metadata["status_message"] == "OK"
-        assert doc1.metadata["status_code"] == 200
-        assert doc1.metadata["politeness_delay"] == 100
-        assert doc1.metadata["total_characters"] == 100
-        assert doc1.metadata["crawled_at"] == "now"
-
-        doc2 = docs[1]
-        assert doc2.page_content == "page 2 content"
-        assert doc2.metadata["page_number"] == 2
-        assert doc2.metadata["url"] == "http://example.com/page2"
-
-    def test_load_sync(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(
-            return_value="mocked markdown content"
-        )  # AsyncMock
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
         loader = AnyparserLoader(file_path="test.pdf", format="markdown")
         docs = loader.load()
         mock_instance.parse.assert_called_once_with("test.pdf")
         assert len(docs) == 1
         assert docs[0].page_content == "mocked markdown content"
 
-    @pytest.mark.asyncio
-    async def test_aload_parser_exception(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(
-            side_effect=Exception("Parser error")
-        )  # AsyncMock
-        loader = AnyparserLoader(file_path="test.pdf")
-        with pytest.raises(ValueError) as excinfo:
-            await loader.aload()
-        assert "Error parsing document with Anyparser: Parser error" in str(
-            excinfo.value
-        )
-
-    @pytest.mark.asyncio
-    async def test_aload_invalid_markdown_html_result_type(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(
-            return_value=["not a string"]
-        )  # AsyncMock, returns invalid type
-        loader = AnyparserLoader(file_path="test.pdf", format="markdown")
-        with pytest.raises(ValueError) as excinfo:
-            await loader.aload()
-        assert "Expected string for markdown format, got: <class 'list'>" in str(
-            excinfo.value
-        )
-
-        loader_html = AnyparserLoader(file_path="test.pdf", format="html")
-        with pytest.raises(ValueError) as excinfo:
-            await loader_html.aload()
-        assert "Expected string for html format, got: <class 'list'>" in str(
-            excinfo.value
-        )
-
-    @pytest.mark.asyncio
-    async def test_aload_invalid_json_result_type(self, mock_anyparser):
-        mock_instance = mock_anyparser.return_value
-        mock_instance.parse = AsyncMock(
-            return_value="not a list"
-        )  # AsyncMock, returns invalid type
-        loader = AnyparserLoader(file_path="test.pdf", format="json")
-        with pytest.raises(ValueError) as excinfo:
-            await loader.aload()
-        assert "Expected list for JSON format, got: <class 'str'>" in str(excinfo.value)
-
-    def test__create_document_from_url(self):
+    def test__create_document_from_url(self, loaders):
         url_result = mock_anyparser_url_result(
             url="http://example.com/test",
             markdown="url content",
@@ -370,7 +399,7 @@ class TestAnyparserLoader:
             total_characters=100,
             crawled_at="now",
         )
-        loader = AnyparserLoader(url="http://example.com", model="crawler")
+        loader = loaders["crawl"]
         doc = loader._create_document_from_url(url_result)
         assert doc.page_content == "url content"
         assert doc.metadata["source"] == "http://example.com/test"
@@ -403,20 +432,34 @@ class TestAnyparserLoader:
         )
         doc_empty = loader._create_document_from_url(url_result_empty)
         assert doc_empty.page_content == ""
+        assert doc_empty.metadata["images"] == []
+
+        url_result_images = mock_anyparser_url_result(
+            images=[
+                AnyparserImageReference(
+                    base64_data="", display_name="logo.png", image_index=0, page=1
+                )
+            ]
+        )
+        doc_images = loader._create_document_from_url(url_result_images)
+        assert doc_images.metadata["images"] == [
+            {"name": "logo.png", "index": 0, "page": 1}
+        ]
 
-    def test__create_document_from_result_base(self):
+    def test__create_document_from_result_base(self, loaders):
         base_result = mock_anyparser_base_result(
             markdown="base content",
         )
-        loader = AnyparserLoader(file_path="test.pdf")
+        loader = loaders["file"]
         docs = loader._create_document_from_result(base_result)
-        assert len(docs) == 1
-        doc = docs[0]
-        assert doc.page_content == "base content"
-        assert doc.metadata["source"] == "test.pdf"
-        assert doc.metadata["rid"] == "test_rid"
-
-    def test__create_document_from_result_pdf(self):
+        assert docs == [
+            Document(
+                page_content="base content",
+                metadata={**EXPECTED_BASE_META, "format": "markdown"},
+            )
+        ]
+
+    def test__create_document_from_result_pdf(self, loaders):
         pdf_result = mock_anyparser_pdf_result(
             items=[
                 mock_anyparser_pdf_page_result(
@@ -427,20 +470,52 @@ class TestAnyparserLoader:
                 ),
             ],
         )
-        loader = AnyparserLoader(file_path="test.pdf")
+        loader = loaders["file"]
+        docs = loader._create_document_from_result(pdf_result)
+        metadata = {**EXPECTED_PDF_META, "format": "markdown"}
+        assert docs == [
+            Document(page_content="pdf page 1 content", metadata=metadata),
+            Document(
+                page_content="pdf page 2 content",
+                metadata={**metadata, "page_number": 2},
+            ),
+        ]
+
+    def test__create_document_from_result_subclass(self, loaders):
+        class CustomPdfResult(AnyparserPdfResult):
+            pass
+
+        pdf_result = CustomPdfResult(
+            rid="test_rid",
+            original_filename="test.pdf",
+            checksum="test_checksum",
+            items=[mock_anyparser_pdf_page_result(markdown="pdf page content")],
+        )
+        loader = loaders["file"]
+        docs = loader._create_document_from_result(pdf_result)
+        assert docs == [
+            Document(
+                page_content="pdf page content",
+                metadata={
+                    **EXPECTED_PDF_META,
+                    "format": "markdown",
+                    "total_pages": 1,
+                    "total_characters": 0,
+                },
+            )
+        ]
+
+    def test__create_document_from_result_loader_subclass_override(self):
+        class CustomLoader(AnyparserLoader):
+            def _from_pdf_result(self, result):
+                yield Document(page_content="custom", metadata={})
+
+        loader = CustomLoader(file_path="test.pdf")
+        pdf_result = mock_anyparser_pdf_result(items=[mock_anyparser_pdf_page_result()])
         docs = loader._create_document_from_result(pdf_result)
-        assert len(docs) == 2
-        doc1 = docs[0]
-        assert doc1.page_content == "pdf page 1 content"
-        assert doc1.metadata["source"] == "test.pdf"
-        assert doc1.metadata["page_number"] == 1
-        assert doc1.metadata["total_pages"] == 2
-
-        doc2 = docs[1]
-        assert doc2.page_content == "pdf page 2 content"
-        assert doc2.metadata["page_number"] == 2
-
-    def test__create_document_from_result_crawl(self):
+        assert docs == [Document(page_content="custom", metadata={})]
+
+    def test__create_document_from_result_crawl(self, loaders):
         crawl_result = mock_anyparser_crawl_result(
             items=[
                 mock_anyparser_url_result(
@@ -451,17 +526,381 @@ class TestAnyparserLoader:
                 ),
             ]
         )
-        loader = AnyparserLoader(url="http://example.com", model="crawler")
+        loader = loaders["crawl"]
         docs = loader._create_document_from_result(crawl_result)
-        assert len(docs) == 2
-        doc1 = docs[0]
-        assert doc1.page_content == "crawl page 1 content"
-        assert doc1.metadata["source"] == "http://example.com/page1"
-        assert doc1.metadata["page_number"] == 1
-        assert doc1.metadata["total_pages"] == 2
-        assert doc1.metadata["url"] == "http://example.com/page1"
-
-        doc2 = docs[1]
-        assert doc2.page_content == "crawl page 2 content"
-        assert doc2.metadata["page_number"] == 2
-        assert doc2.metadata["url"] == "http://example.com/page2"
+        metadata = {**EXPECTED_URL_META, "format": "markdown"}
+        assert docs == [
+            Document(page_content="crawl page 1 content", metadata=metadata),
+            Document(
+                page_content="crawl page 2 content",
+                metadata={
+                    **metadata,
+                    "source": "http://example.com/page2",
+                    "page_number": 2,
+                    "url": "http://example.com/page2",
+                },
+            ),
+        ]
+
+
+class TestAnyparserLoaderAsync:
+    # Share one module-scoped event loop between the async tests
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+    @pytest.mark.parametrize("fmt", ["markdown", "html"])
+    async def test_aload_string_format(self, mock_anyparser, fmt, make_parse_mock):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value=f"mocked {fmt} content")
+        loader = AnyparserLoader(file_path="test.pdf", format=fmt)
+        docs = await loader.aload()
+        mock_instance.parse.assert_called_once_with("test.pdf")
+        assert docs == [
+            Document(
+                page_content=f"mocked {fmt} content",
+                metadata={"source": "test.pdf", "format": fmt},
+            )
+        ]
+
+    async def test_aload_formats_concurrently(self, make_parse_mock):
+        results = {
+            "test.md": "mocked markdown content",
+            "test.html": "mocked html content",
+        }
+        parser = SimpleNamespace(
+            options=None, parse=make_parse_mock(side_effect=results.__getitem__)
+        )
+        markdown_docs, html_docs = await asyncio.gather(
+            AnyparserLoader.from_shared(parser, "test.md", "markdown", "text").aload(),
+            AnyparserLoader.from_shared(parser, "test.html", "html", "text").aload(),
+        )
+        assert parser.parse.await_count == 2
+
+        assert len(markdown_docs) == 1
+        assert markdown_docs[0].page_content == "mocked markdown content"
+        assert markdown_docs[0].metadata["source"] == "test.md"
+        assert markdown_docs[0].metadata["format"] == "markdown"
+
+        assert len(html_docs) == 1
+        assert html_docs[0].page_content == "mocked html content"
+        assert html_docs[0].metadata["source"] == "test.html"
+        assert html_docs[0].metadata["format"] == "html"
+
+    @pytest.mark.parametrize("builder,loader_kwargs,expected", JSON_CASES)
+    async def test_aload_json_format(
+        self, mock_anyparser, make_parse_mock, builder, loader_kwargs, expected
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value=builder())
+        loader = AnyparserLoader(format="json", **loader_kwargs)
+        docs = await loader.aload()
+        mock_instance.parse.assert_called_once_with(loader.file_path)
+        assert docs == expected
+
+    async def test_alazy_load_json_format_crawl_result(
+        self, mock_anyparser, make_parse_mock
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_result = mock_anyparser_crawl_result(
+            items=[
+                mock_anyparser_url_result(
+                    url="http://example.com/page1", markdown="page 1 content"
+                ),
+                mock_anyparser_url_result(
+                    url="http://example.com/page2", markdown="page 2 content"
+                ),
+            ]
+        )
+        mock_instance.parse = make_parse_mock(return_value=[mock_result])
+        loader = AnyparserLoader(
+            url="http://example.com", model="crawler", format="json"
+        )
+        documents = loader.alazy_load()
+        doc1 = await documents.__anext__()
+        assert doc1 == Document(
+            page_content="page 1 content", metadata=EXPECTED_URL_META
+        )
+        remaining = [doc async for doc in documents]
+        assert remaining == [
+            Document(
+                page_content="page 2 content",
+                metadata={
+                    **EXPECTED_URL_META,
+                    "source": "http://example.com/page2",
+                    "page_number": 2,
+                    "url": "http://example.com/page2",
+                },
+            )
+        ]
+        mock_instance.parse.assert_called_once_with("http://example.com")
+
+    async def test_load_sync_inside_running_loop(self, mock_anyparser):
+        loader = AnyparserLoader(file_path="test.pdf", format="markdown")
+        with pytest.raises(RuntimeError, match=r"Use aload\(\) from within an async"):
+            loader.load()
+        mock_anyparser.return_value.parse.assert_not_called()
+
+    async def test_from_shared(self, mock_anyparser, make_parse_mock):
+        parser = MagicMock()
+        parser.options.format = "markdown"
+        parser.options.model = "text"
+        parser.parse = make_parse_mock(return_value="mocked markdown content")
+        loaders = [
+            AnyparserLoader.from_shared(parser, path) for path in ("a.pdf", "b.pdf")
+        ]
+        docs = [doc for loader in loaders for doc in await loader.aload()]
+        mock_anyparser.assert_not_called()
+        assert all(loader.parser is parser for loader in loaders)
+        assert all(loader.options is parser.options for loader in loaders)
+        assert all(loader.format == "markdown" for loader in loaders)
+        assert all(loader.model == "text" for loader in loaders)
+        assert [doc.metadata["source"] for doc in docs] == ["a.pdf", "b.pdf"]
+        assert parser.parse.await_count == 2
+
+    async def test_from_shared_parser_without_options(
+        self, result_cache, tmp_path, make_parse_mock
+    ):
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"pdf bytes")
+        parser = Anyparser()
+        parser.parse = make_parse_mock(return_value=[mock_anyparser_base_result()])
+        loader = AnyparserLoader.from_shared(parser, str(file_path), cache=True)
+        assert loader.options == AnyparserOption()
+        assert (loader.format, loader.model) == ("json", "text")
+        docs = await loader.aload()
+        assert docs[0].metadata["format"] == "json"
+        assert len(result_cache) == 1
+
+    async def test_aload_many(self, mock_anyparser, make_parse_mock):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(
+            side_effect=lambda file_path: f"content of {file_path}"
+        )
+        docs = await AnyparserLoader.aload_many(
+            ["a.pdf", "b.docx"], anyparser_api_key="test_key", format="html"
+        )
+        mock_anyparser.assert_called_once()
+        options = mock_anyparser.call_args.kwargs["options"]
+        assert options.api_key == "test_key"
+        assert options.format == "html"
+        assert mock_instance.parse.await_count == 2
+        assert [doc.page_content for doc in docs] == [
+            "content of a.pdf",
+            "content of b.docx",
+        ]
+        assert [doc.metadata["source"] for doc in docs] == ["a.pdf", "b.docx"]
+        assert all(doc.metadata["format"] == "html" for doc in docs)
+
+    async def test_aload_many_max_concurrency(self, mock_anyparser, make_parse_mock):
+        in_flight = 0
+        peak = 0
+
+        async def parse(file_path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return file_path
+
+        mock_anyparser.return_value.parse = make_parse_mock(side_effect=parse)
+        docs = await AnyparserLoader.aload_many(
+            [f"{i}.pdf" for i in range(5)], max_concurrency=2
+        )
+        assert len(docs) == 5
+        assert peak == 2
+
+    async def test_aload_many_cancels_pending_on_failure(
+        self, mock_anyparser, make_parse_mock
+    ):
+        finished = []
+
+        async def parse(file_path):
+            if file_path == "bad.pdf":
+                raise ValueError("bad file")
+            await asyncio.sleep(0.01)
+            finished.append(file_path)
+            return file_path
+
+        mock_anyparser.return_value.parse = make_parse_mock(side_effect=parse)
+        with pytest.raises(ValueError, match="bad file"):
+            await AnyparserLoader.aload_many(["bad.pdf", "good1.pdf", "good2.pdf"])
+        await asyncio.sleep(0.02)
+        assert finished == []
+
+    async def test_aload_many_invalid_max_concurrency(self, mock_anyparser):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            await AnyparserLoader.aload_many(["a.pdf"], max_concurrency=0)
+        mock_anyparser.assert_not_called()
+
+    async def test_aload_cache_hit(
+        self, mock_anyparser, result_cache, tmp_path, make_parse_mock
+    ):
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"pdf bytes")
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
+        loader = AnyparserLoader(file_path=str(file_path), cache=True)
+
+        docs = await loader.aload()
+        docs[0].metadata["source"] = "changed by caller"
+        cached_docs = await loader.aload()
+
+        mock_instance.parse.assert_called_once_with(str(file_path))
+        assert len(result_cache) == 1
+        assert cached_docs[0].page_content == "mocked markdown content"
+        assert cached_docs[0].metadata["source"] == str(file_path)
+
+        # Same content with different options is parsed again
+        html_loader = AnyparserLoader(
+            file_path=str(file_path), format="html", cache=True
+        )
+        await html_loader.aload()
+        assert mock_instance.parse.call_count == 2
+        assert len(result_cache) == 2
+
+    async def test_aload_cache_key_omits_api_key(
+        self, mock_anyparser, result_cache, tmp_path, make_parse_mock
+    ):
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"pdf bytes")
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
+        for api_key in ("first_secret", "second_secret"):
+            await AnyparserLoader(
+                file_path=str(file_path), anyparser_api_key=api_key, cache=True
+            ).aload()
+
+        mock_instance.parse.assert_called_once()
+        assert "secret" not in repr(list(result_cache))
+
+    async def test_aload_cache_keyed_on_path(
+        self, mock_anyparser, result_cache, tmp_path, make_parse_mock
+    ):
+        first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        first.write_bytes(b"pdf bytes")
+        second.write_bytes(b"pdf bytes")
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(
+            side_effect=lambda file_path: [
+                mock_anyparser_base_result(original_filename=file_path)
+            ]
+        )
+
+        for path in (first, second):
+            loader = AnyparserLoader(file_path=str(path), format="json", cache=True)
+            docs = await loader.aload()
+            assert docs[0].metadata["source"] == str(path)
+            assert docs[0].metadata["original_filename"] == str(path)
+
+        assert mock_instance.parse.call_count == 2
+        assert len(result_cache) == 2
+
+    async def test_aload_cache_disabled(
+        self, mock_anyparser, result_cache, tmp_path, make_parse_mock
+    ):
+        file_path = tmp_path / "test.pdf"
+        file_path.write_bytes(b"pdf bytes")
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
+        loader = AnyparserLoader(file_path=str(file_path))
+        await loader.aload()
+        await loader.aload()
+        assert mock_instance.parse.call_count == 2
+        assert len(result_cache) == 0
+
+    async def test_aload_cache_skips_non_local_sources(
+        self, mock_anyparser, result_cache, make_parse_mock
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
+        crawl_loader = AnyparserLoader(
+            url="http://example.com", model="crawler", cache=True
+        )
+        url_loader = AnyparserLoader(url="http://example.com", cache=True)
+        missing_loader = AnyparserLoader(file_path="missing.pdf", cache=True)
+        for loader in (crawl_loader, url_loader, missing_loader) * 2:
+            await loader.aload()
+        assert mock_instance.parse.call_count == 6
+        assert len(result_cache) == 0
+
+    async def test_aload_cache_evicts_least_recently_used(
+        self, mock_anyparser, result_cache, tmp_path, monkeypatch, make_parse_mock
+    ):
+        monkeypatch.setattr(AnyparserLoader, "cache_maxsize", 1)
+        first, second = tmp_path / "first.pdf", tmp_path / "second.pdf"
+        first.write_bytes(b"first")
+        second.write_bytes(b"second")
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value="mocked markdown content")
+        for path in (first, second, first):
+            await AnyparserLoader(file_path=str(path), cache=True).aload()
+        assert mock_instance.parse.call_count == 3
+        assert len(result_cache) == 1
+
+    async def test_aload_parser_exception(self, mock_anyparser, make_parse_mock):
+        mock_instance = mock_anyparser.return_value
+        parser_error = ValueError("Parser error")
+        mock_instance.parse = make_parse_mock(side_effect=parser_error)
+        loader = AnyparserLoader(file_path="test.pdf")
+        with pytest.raises(
+            ValueError, match="Error parsing document with Anyparser: Parser error"
+        ) as excinfo:
+            await loader.aload()
+        assert excinfo.value.__cause__ is parser_error
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            http.client.HTTPException("HTTP 503: unavailable"),
+            ConnectionResetError("connection reset"),
+            FileNotFoundError("File test.pdf does not exist"),
+            asyncio.CancelledError(),
+        ],
+    )
+    async def test_aload_parser_exception_not_wrapped(
+        self, mock_anyparser, error, make_parse_mock
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(side_effect=error)
+        loader = AnyparserLoader(file_path="test.pdf")
+        with pytest.raises(type(error)) as excinfo:
+            await loader.aload()
+        assert excinfo.value is error
+
+    @pytest.mark.parametrize("fmt", ["markdown", "html"])
+    async def test_aload_invalid_string_result_type(
+        self, mock_anyparser, fmt, make_parse_mock
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(
+            return_value=["not a string"]
+        )  # returns invalid type
+        loader = AnyparserLoader(file_path="test.pdf", format=fmt)
+        with pytest.raises(
+            ValueError, match=f"Expected string for {fmt} format, got: <class 'list'>"
+        ):
+            await loader.aload()
+
+    async def test_aload_malformed_json_result(self, mock_anyparser, make_parse_mock):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(return_value=[{"markdown": "content"}])
+        loader = AnyparserLoader(file_path="test.pdf", format="json")
+        with pytest.raises(
+            ValueError,
+            match="Error parsing document with Anyparser: 'dict' object has no attribute",
+        ) as exc_info:
+            await loader.aload()
+        assert isinstance(exc_info.value.__cause__, AttributeError)
+
+    async def test_aload_invalid_json_result_type(
+        self, mock_anyparser, make_parse_mock
+    ):
+        mock_instance = mock_anyparser.return_value
+        mock_instance.parse = make_parse_mock(
+            return_value="not a list"
+        )  # returns invalid type
+        loader = AnyparserLoader(file_path="test.pdf", format="json")
+        with pytest.raises(
+            ValueError, match="Expected list for JSON format, got: <class 'str'>"
+        ):
+            await loader.aload()